@@ -8,7 +8,8 @@ import logging
 import logging.config
 import os
 import StringIO
-from hashlib import md5
+import zlib
+from itertools import chain
 
 import luigi
 import luigi.contrib.hadoop
@@ -187,7 +188,7 @@ class EmulatedMapReduceJobRunner(luigi.contrib.hadoop.JobRunner):
         lines = []
         for i, line in enumerate(input):
             parts = line.rstrip('\n').split('\t')
-            blob = md5(str(i)).hexdigest()  # pseudo-random blob to make sure the input isn't sorted
+            blob = zlib.crc32(str(i))  # pseudo-random blob to make sure the input isn't sorted
             lines.append((parts[:-1], blob, line))
         for _, _, line in sorted(lines):
             output.write(line)
@@ -275,12 +276,21 @@ class MultiOutputMapReduceJobTask(MapReduceJobTask):
         """
         Write out values from each key into different output files.
         """
+        # Peek at the first value before opening the output target.  Opening
+        # an S3 or HDFS target for writing has real latency and creates the
+        # remote file, so avoid paying that for a key with no values at all.
+        values = iter(values)
+        try:
+            first_value = next(values)
+        except StopIteration:
+            return iter(tuple())
+
         output_path = self.output_path_for_key(key)
         if output_path:
             log.info('Writing output file: %s', output_path)
             output_file_target = get_target_from_url(output_path)
             with output_file_target.open('w') as output_file:
-                self.multi_output_reducer(key, values, output_file)
+                self.multi_output_reducer(key, chain((first_value,), values), output_file)
 
         # Luigi requires the reducer to return an iterable
         return iter(tuple())
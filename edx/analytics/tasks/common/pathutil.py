@@ -11,6 +11,7 @@ import fnmatch
 import logging
 import os
 import re
+from multiprocessing.dummy import Pool as ThreadPool
 
 import luigi
 import luigi.contrib.hdfs
@@ -50,6 +51,7 @@ class PathSetTask(luigi.Task):
     def __init__(self, *args, **kwargs):
         super(PathSetTask, self).__init__(*args, **kwargs)
         self.s3_conn = None
+        self.requirements = None
 
     def generate_file_list(self):
         """Yield each individual path given a source folder and a set of file-matching expressions."""
@@ -81,17 +83,26 @@ class PathSetTask(luigi.Task):
         """Write each individual path to a manifest file and yield the path to that file."""
         manifest_target = get_target_from_url(self.manifest)
         if not manifest_target.exists():
+            urls = [external_url_task.url for external_url_task in self.generate_file_list()]
             with manifest_target.open('w') as manifest_file:
-                for external_url_task in self.generate_file_list():
-                    manifest_file.write(external_url_task.url + '\n')
+                # Join the URLs and write them in one call, rather than making
+                # a write call per entry.
+                if urls:
+                    manifest_file.write('\n'.join(urls) + '\n')
 
         yield ExternalURL(self.manifest)
 
     def requires(self):
-        if self.manifest is not None:
-            return self.manifest_file_list()
-        else:
-            return self.generate_file_list()
+        # Luigi calls requires() repeatedly while scheduling, and output()
+        # calls it again below.  Generating the file list walks the source
+        # directory (or lists the S3 bucket), so only do that work once and
+        # reuse the resulting list on subsequent calls.
+        if self.requirements is None:
+            if self.manifest is not None:
+                self.requirements = list(self.manifest_file_list())
+            else:
+                self.requirements = list(self.generate_file_list())
+        return self.requirements
 
     def complete(self):
         # An optimization: just declare that the task is always
@@ -168,6 +179,19 @@ class PathSelectionByDateIntervalTask(EventLogSelectionDownstreamMixin, luigi.Wr
         This can be a rather expensive operation that requires usage of the S3 API to list all files in the source
         bucket and select the ones that are applicable to the given date range.
         """
+        # Listing an S3 source is latency-bound, so when several are
+        # configured, fetch their listings concurrently on a small thread
+        # pool.  The results land in the listing cache, which the sequential
+        # loop below then reads without further S3 calls.
+        s3_sources = [source for source in self.source if source.startswith('s3')]
+        if len(s3_sources) > 1:
+            pool = ThreadPool(min(len(s3_sources), 4))
+            try:
+                pool.map(self._get_s3_urls, s3_sources)
+            finally:
+                pool.close()
+                pool.join()
+
         url_gens = []
         for source in self.source:
             if source.startswith('s3'):
@@ -182,17 +206,39 @@ class PathSelectionByDateIntervalTask(EventLogSelectionDownstreamMixin, luigi.Wr
             'Date interval: %s <= date < %s', self.interval.date_a.isoformat(), self.interval.date_b.isoformat()
         )
 
-        return [UncheckedExternalURL(url) for url_gen in url_gens for url in url_gen if self.should_include_url(url)]
+        # Overlapping sources can yield the same URL more than once.  Track the
+        # URLs already seen in a set, so duplicates are skipped with an O(1)
+        # membership test before paying for the pattern match below.
+        seen_urls = set()
+        requirements = []
+        for url_gen in url_gens:
+            for url in url_gen:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                if self.should_include_url(url):
+                    requirements.append(UncheckedExternalURL(url))
+        return requirements
+
+    # Cache of S3 listing results, keyed by source URL and shared across task
+    # instances.  Recursively listing a large event-log bucket can take
+    # thousands of S3 LIST calls, and several tasks in the same run typically
+    # select from the same sources, so only pay that cost once per process.
+    _s3_listing_cache = {}
 
     def _get_s3_urls(self, source):
         """Recursively list all files inside the source URL directory."""
-        s3_conn = ScalableS3Client().s3
-        bucket_name, root = get_s3_bucket_key_names(source)
-        bucket = s3_conn.get_bucket(bucket_name)
-        for key_metadata in bucket.list(root):
-            if key_metadata.size > 0:
-                key_path = key_metadata.key[len(root):].lstrip('/')
-                yield url_path_join(source, key_path)
+        if source not in self._s3_listing_cache:
+            s3_conn = ScalableS3Client().s3
+            bucket_name, root = get_s3_bucket_key_names(source)
+            bucket = s3_conn.get_bucket(bucket_name)
+            urls = []
+            for key_metadata in bucket.list(root):
+                if key_metadata.size > 0:
+                    key_path = key_metadata.key[len(root):].lstrip('/')
+                    urls.append(url_path_join(source, key_path))
+            self._s3_listing_cache[source] = urls
+        return self._s3_listing_cache[source]
 
     def _get_hdfs_urls(self, source):
         """Recursively list all files inside the source directory on the hdfs filesystem."""
@@ -264,8 +310,32 @@ class EventLogSelectionMixin(EventLogSelectionDownstreamMixin):
         self.lower_bound_date_string = self.interval.date_a.strftime('%Y-%m-%d')  # pylint: disable=no-member
         self.upper_bound_date_string = self.interval.date_b.strftime('%Y-%m-%d')  # pylint: disable=no-member
 
+    # Substrings that indicate the presence of a usable time field in a raw
+    # log line.  A line containing none of them would have its event time
+    # discarded below anyway, so it can be skipped before paying the cost of
+    # JSON parsing.  This list must cover every key that get_event_time()
+    # implementations consult, including the segment event keys "receivedAt",
+    # "requestTime" and "timestamp"; subclasses reading other keys should
+    # extend it.  Note that each entry includes the opening quote, so one key
+    # name being a substring of another (e.g. "time") does not make its entry
+    # redundant.
+    time_field_markers = (
+        '"time"',
+        '"timestamp"',
+        '"sentAt"',
+        '"received_at"',
+        '"receivedAt"',
+        '"requestTime"',
+    )
+
     def get_event_and_date_string(self, line):
         """Default mapper implementation, that always outputs the log line, but with a configurable key."""
+        # Skip lines that cannot possibly contain a usable time field before
+        # paying the cost of parsing them as JSON.
+        if not any(marker in line for marker in self.time_field_markers):
+            self.incr_counter('Event', 'Discard Missing Time Field', 1)
+            return None
+
         event = eventlog.parse_json_event(line)
         if event is None:
             self.incr_counter('Event', 'Discard Unparseable Event', 1)
@@ -279,8 +349,9 @@ class EventLogSelectionMixin(EventLogSelectionDownstreamMixin):
         # Don't use strptime to parse the date, it is extremely slow
         # to do so. Instead rely on alphanumeric comparisons.  The
         # timestamp is ISO8601 formatted, so dates will look like
-        # %Y-%m-%d.  For example: 2014-05-20.
-        date_string = event_time.split("T")[0]
+        # %Y-%m-%d.  For example: 2014-05-20.  Slice rather than split
+        # on "T", to avoid allocating a list and a time substring.
+        date_string = event_time[:10]
 
         if date_string < self.lower_bound_date_string or date_string >= self.upper_bound_date_string:
             # Slow: self.incr_counter('Event', 'Discard Outside Date Interval', 1)
@@ -299,13 +370,14 @@ class EventLogSelectionMixin(EventLogSelectionDownstreamMixin):
         """Get the name of the input file from Hadoop."""
         # Hadoop sets an environment variable with the full URL of the input file. This url will be something like:
         # s3://bucket/root/host1/tracking.log.gz. In this example, assume self.source is "s3://bucket/root".
-        try:
-            return os.environ['mapreduce_map_input_file']
-        except KeyError:
-            try:
-                # Older versions of Hadoop support a deprecated key, so also try that.
-                return os.environ['map_input_file']
-            except KeyError:
-                log.warn('mapreduce_map_input_file not defined in os.environ, unable to determine input file path')
-                self.incr_counter('Event', 'Missing map_input_file', 1)
-                return ''
+        # This is called once per line by some mappers, so look the keys up
+        # with get() rather than repeatedly raising and catching KeyError.
+        input_file = os.environ.get('mapreduce_map_input_file')
+        if input_file is None:
+            # Older versions of Hadoop support a deprecated key, so also try that.
+            input_file = os.environ.get('map_input_file')
+        if input_file is None:
+            log.warn('mapreduce_map_input_file not defined in os.environ, unable to determine input file path')
+            self.incr_counter('Event', 'Missing map_input_file', 1)
+            input_file = ''
+        return input_file
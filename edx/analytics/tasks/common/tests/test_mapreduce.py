@@ -116,6 +116,10 @@ class MultiOutputMapReduceJobTaskTest(unittest.TestCase):
         self.assert_values_written_to_file('foo', ['bar', 'baz'])
         self.assert_values_written_to_file('foo2', ['bar2'])
 
+    def test_reducer_with_no_values(self):
+        self.assertItemsEqual(self.task.reducer('foo', []), [])
+        self.assertFalse(self.mock_get_target.called)
+
 
 class MultiOutputMapReduceJobTaskOutputRootTest(unittest.TestCase):
     """Tests for output_root behavior of MultiOutputMapReduceJobTask."""
@@ -59,6 +59,9 @@ class PathSelectionByDateIntervalTaskTest(unittest.TestCase):
     COMPLETE_SOURCE_PATHS = COMPLETE_SOURCE_PATHS_1 + COMPLETE_SOURCE_PATHS_2
     SOURCE = [SOURCE_1, SOURCE_2]
 
+    def setUp(self):
+        PathSelectionByDateIntervalTask._s3_listing_cache.clear()
+
     @patch('luigi.contrib.s3.S3Client.s3')
     def test_requires(self, connect_s3_mock):
         s3_conn_mock = connect_s3_mock
@@ -89,6 +92,32 @@ class PathSelectionByDateIntervalTaskTest(unittest.TestCase):
             [UncheckedExternalURL(source + path) for path in expected_paths for source in self.SOURCE]
         )
 
+    @patch('luigi.contrib.s3.S3Client.s3')
+    def test_s3_listing_cached_across_instances(self, connect_s3_mock):
+        s3_conn_mock = connect_s3_mock
+        bucket_mock = s3_conn_mock.get_bucket.return_value
+
+        class FakeKey(object):
+            """A test double of the structure returned by boto when listing keys in an S3 bucket."""
+            def __init__(self, path):
+                self.key = path
+                self.size = 10
+
+        bucket_mock.list.return_value = [FakeKey(path) for path in self.SAMPLE_KEY_PATHS]
+
+        for interval in ('2014-03', '2014-04'):
+            task = PathSelectionByDateIntervalTask(
+                source=self.SOURCE,
+                interval=Month.parse(interval),
+                pattern=[r'.*?FakeServerGroup/tracking.log-(?P<date>\d{8}).*\.gz'],
+                expand_interval=datetime.timedelta(0),
+            )
+            task.requires()
+
+        # The second task instance should reuse the cached listings, so each
+        # source should only have been listed once.
+        self.assertEquals(bucket_mock.list.call_count, len(self.SOURCE))
+
     def test_default_source(self):
         task = PathSelectionByDateIntervalTask(interval=Month.parse('2014-03'))
         self.assertEquals(task.source, ('s3://fake/input/', 's3://fake/input2/'))
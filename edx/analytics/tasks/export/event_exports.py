@@ -125,7 +125,10 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
             # unicode() then without this change they would appear as u'FooX' and 'FooX' in the final key
             # string. Although python doesn't care about this difference, hadoop does, and will bucket the
             # values separately. Which is not what we want.
-            yield tuple([value.encode('utf8') for value in key]), line.strip()
+            # Intern the key parts: the same few dates and org_ids repeat for
+            # millions of events, so share one string object for each value
+            # rather than allocating a fresh copy per event.
+            yield tuple([intern(value.encode('utf8')) for value in key]), line.strip()
 
     def get_event_time(self, event):
         # Some events may emitted and stored for quite some time before actually being entered into the tracking logs.
@@ -187,11 +190,12 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
         try:
             with make_encrypted_file(output_file, key_file_targets, progress=report_progress,
                                      hadoop_counter_incr_func=self.event_export_counter) as encrypted_output_file:
-                outfile = gzip.GzipFile(mode='wb', fileobj=encrypted_output_file)
+                outfile = gzip.GzipFile(mode='wb', fileobj=encrypted_output_file, mtime=0)
                 try:
                     for value in values:
-                        outfile.write(value.strip())
-                        outfile.write('\n')
+                        # Write the event and its newline as a single call, to halve
+                        # the number of compress-and-CRC updates done by GzipFile.
+                        outfile.write(value.strip() + '\n')
                         # WARNING: This line ensures that Hadoop knows that our process is not sitting in an infinite
                         # loop.  Do not remove it.
                         self.event_export_counter(counter_title='Raw Bytes Written', incr_value=(len(value) + 1))
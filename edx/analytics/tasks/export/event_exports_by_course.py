@@ -1,6 +1,5 @@
 """Group events by course and export them for research purposes"""
 
-import gzip
 import logging
 
 import luigi.date_interval
@@ -9,6 +8,7 @@ import edx.analytics.tasks.util.opaque_key_util as opaque_key_util
 from edx.analytics.tasks.common.mapreduce import MultiOutputMapReduceJobTask
 from edx.analytics.tasks.common.pathutil import EventLogSelectionMixin
 from edx.analytics.tasks.util import eventlog
+from edx.analytics.tasks.util.file_util import open_gzip_stream
 from edx.analytics.tasks.util.url import url_path_join
 
 log = logging.getLogger(__name__)
@@ -39,7 +39,10 @@ class EventExportByCourseTask(EventLogSelectionMixin, MultiOutputMapReduceJobTas
             return
 
         key = (date_string, course_id)
-        yield tuple([value.encode('utf8') for value in key]), line.strip()
+        # Intern the key parts: the same few dates and course_ids repeat for
+        # millions of events, so share one string object for each value rather
+        # than allocating a fresh copy per event.
+        yield tuple([intern(value.encode('utf8')) for value in key]), line.strip()
 
     def get_event_time(self, event):
         # Some events may emitted and stored for quite some time before actually being entered into the tracking logs.
@@ -67,14 +70,27 @@ class EventExportByCourseTask(EventLogSelectionMixin, MultiOutputMapReduceJobTas
             )
         )
 
+    # Number of events to buffer before flushing them to the compressor in a
+    # single write.  Typical events run about a kilobyte, so this produces
+    # roughly megabyte-sized writes, which amortize the per-call overhead of
+    # the compression stream and let zlib see bigger blocks.
+    output_buffer_count = 1024
+
     def multi_output_reducer(self, _key, values, output_file):
-        with gzip.GzipFile(mode='wb', fileobj=output_file) as outfile:
-            try:
-                for value in values:
-                    outfile.write(value.strip())
-                    outfile.write('\n')
-                    # WARNING: This line ensures that Hadoop knows that our process is not sitting in an infinite loop.
-                    # Do not remove it.
-                    self.incr_counter('Event Export', 'Raw Bytes Written', len(value) + 1)
-            finally:
-                outfile.close()
+        with open_gzip_stream(output_file) as outfile:
+            event_buffer = []
+            for value in values:
+                event_buffer.append(value.strip())
+                if len(event_buffer) >= self.output_buffer_count:
+                    self._flush_event_buffer(event_buffer, outfile)
+            if event_buffer:
+                self._flush_event_buffer(event_buffer, outfile)
+
+    def _flush_event_buffer(self, event_buffer, outfile):
+        """Write the buffered events to the output stream in a single call, and empty the buffer."""
+        chunk = '\n'.join(event_buffer) + '\n'
+        outfile.write(chunk)
+        del event_buffer[:]
+        # WARNING: This line ensures that Hadoop knows that our process is not sitting in an infinite loop.
+        # Do not remove it.
+        self.incr_counter('Event Export', 'Raw Bytes Written', len(chunk))
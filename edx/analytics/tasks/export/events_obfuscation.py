@@ -74,7 +74,8 @@ class ObfuscateCourseEventsTask(ObfuscatorMixin, GeolocationMixin, MultiOutputMa
 
     def mapper(self, line):
         event = eventlog.parse_json_event(line)
-        date_string = event['time'].split("T")[0]
+        # The date is the fixed-width %Y-%m-%d prefix of the ISO8601 timestamp.
+        date_string = event['time'][:10]
 
         filtered_event = self._filter_event(event)
         if filtered_event is None:
@@ -83,12 +84,13 @@ class ObfuscateCourseEventsTask(ObfuscatorMixin, GeolocationMixin, MultiOutputMa
         yield date_string.encode('utf-8'), line.rstrip('\r\n')
 
     def multi_output_reducer(self, _key, values, output_file):
-        with gzip.GzipFile(mode='wb', fileobj=output_file) as outfile:
+        with gzip.GzipFile(mode='wb', fileobj=output_file, mtime=0) as outfile:
             try:
                 for value in values:
                     obfuscated_event_line = self.obfuscate_event_line(value)
-                    outfile.write(obfuscated_event_line)
-                    outfile.write('\n')
+                    # Write the event and its newline as a single call, to halve
+                    # the number of compress-and-CRC updates done by GzipFile.
+                    outfile.write(obfuscated_event_line + '\n')
                     # WARNING: This line ensures that Hadoop knows that our process is not sitting in an infinite loop.
                     # Do not remove it.
                     self.incr_counter('Obfuscated Event Exports', 'Raw Bytes Written', len(value) + 1)
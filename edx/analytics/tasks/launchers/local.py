@@ -35,6 +35,12 @@ import six
 import stevedore
 import urllib3
 
+try:
+    # ujson is optional; event parsing falls back to cjson without it.
+    import ujson
+except ImportError:
+    ujson = None
+
 import edx.analytics.tasks
 
 # Tell urllib3 to switch the ssl backend to PyOpenSSL.
@@ -93,7 +99,8 @@ def main():
     # Tell luigi what dependencies to pass to the Hadoop nodes:
     # - edx.analytics.tasks is used to load the pipeline code, since we cannot trust all will be loaded automatically.
     # - boto is used for all direct interactions with s3.
-    # - cjson is used for all parsing event logs.
+    # - cjson is used for all parsing event logs (with ujson preferred for
+    #   decoding when available).
     # - filechunkio is used for multipart uploads of large files to s3.
     # - opaque_keys is used to interpret serialized course_ids
     #   - opaque_keys extensions:  ccx_keys
@@ -102,6 +109,8 @@ def main():
     #   - chardet, urllib3, certifi, idna
     luigi.contrib.hadoop.attach(edx.analytics.tasks)
     luigi.contrib.hadoop.attach(boto, cjson, filechunkio, opaque_keys, bson, stevedore, six, ciso8601, chardet, urllib3, certifi, idna, requests, pytz)
+    if ujson is not None:
+        luigi.contrib.hadoop.attach(ujson)
 
     if configuration.getboolean('ccx', 'enabled', default=False):
         import ccx_keys
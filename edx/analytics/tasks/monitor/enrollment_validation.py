@@ -642,10 +642,11 @@ class CourseEnrollmentValidationPerDateTask(
         yield datestamp, values
 
     def multi_output_reducer(self, _key, values, output_file):
-        with gzip.GzipFile(mode='wb', fileobj=output_file) as outfile:
+        with gzip.GzipFile(mode='wb', fileobj=output_file, mtime=0) as outfile:
             for value in values:
-                outfile.write(value)
-                outfile.write('\n')
+                # Write the event and its newline as a single call, to halve
+                # the number of compress-and-CRC updates done by GzipFile.
+                outfile.write(value + '\n')
 
     def output_path_for_key(self, datestamp):
         if not self.tuple_output:
@@ -779,10 +780,11 @@ class CreateEnrollmentValidationEventsTask(MultiOutputMapReduceJobTask):
         yield encoded_course_id, event
 
     def multi_output_reducer(self, _key, values, output_file):
-        with gzip.GzipFile(mode='wb', fileobj=output_file) as outfile:
+        with gzip.GzipFile(mode='wb', fileobj=output_file, mtime=0) as outfile:
             for value in values:
-                outfile.write(value)
-                outfile.write('\n')
+                # Write the event and its newline as a single call, to halve
+                # the number of compress-and-CRC updates done by GzipFile.
+                outfile.write(value + '\n')
 
     def output_path_for_key(self, encoded_course_id):
         course_id = encoded_course_id.decode('utf-8')
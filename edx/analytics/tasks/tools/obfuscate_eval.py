@@ -233,7 +233,7 @@ class BulkObfuscator(object):
                 filename = os.path.basename(input_filepath)
                 output_path = os.path.join(output_dir, filename)
                 with open(output_path, 'w') as output_file:
-                    with gzip.GzipFile(mode='wb', fileobj=output_file) as outfile:
+                    with gzip.GzipFile(mode='wb', fileobj=output_file, mtime=0) as outfile:
                         for line in infile:
                             clean_line = self.obfuscate_event_entry(line)
                             outfile.write(clean_line)
@@ -1,28 +1,58 @@
 """Support for reading tracking event logs."""
 
 import datetime
+import json
 import logging
-import re
 
-import cjson
+try:
+    # cjson is a CPython extension module, so it is not importable on
+    # alternative interpreters such as PyPy.  Treat it as optional so that
+    # the parsing code can run anywhere, at worst on the stdlib json module.
+    import cjson
+except ImportError:
+    cjson = None
+
+try:
+    # ujson's C parser is significantly faster than cjson on nested event
+    # payloads, so prefer it when it is installed.  The module will not be
+    # available on all slave nodes, so fall back to cjson there.
+    import ujson
+except ImportError:
+    ujson = None
 
 import edx.analytics.tasks.util.opaque_key_util as opaque_key_util
 
 log = logging.getLogger(__name__)
 
-PATTERN_JSON = re.compile(r'^.*?(\{.*\})\s*$')
-
 
 def decode_json(line):
     """Wrapper to decode JSON string in an implementation-independent way."""
-    # TODO: Verify correctness of cjson
-    return cjson.decode(line)
+    if ujson is not None:
+        try:
+            return ujson.loads(line)
+        except ValueError:
+            # ujson cannot represent integers of 2**64 or more ("Value is
+            # too big!"), which the other decoders handle fine, so fall
+            # through and retry rather than discarding a valid line.  A
+            # genuinely unparseable line fails again below and raises from
+            # there.
+            pass
+    if cjson is not None:
+        return cjson.decode(line)
+    return json.loads(line)
 
 
 def encode_json(obj):
-    """Wrapper to re-encode JSON string in an implementation-independent way."""
-    # TODO: Verify correctness of cjson
-    return cjson.encode(obj)
+    """
+    Wrapper to re-encode JSON string in an implementation-independent way.
+
+    Note that ujson is deliberately not used here: its encoder defaults to
+    ten digits of float precision and switches large values to scientific
+    notation, silently changing values in exported events.
+    """
+    if cjson is not None:
+        return cjson.encode(obj)
+    return json.dumps(obj)
 
 
 def parse_json_event(line, nested=False):
@@ -40,9 +70,14 @@ def parse_json_event(line, nested=False):
         parsed = decode_json(line)
     except Exception:
         if not nested:
-            json_match = PATTERN_JSON.match(line)
-            if json_match:
-                return parse_json_event(json_match.group(1), nested=True)
+            # Find the JSON payload between the first "{" and the last "}",
+            # using find/rfind rather than a regex: for very long event lines
+            # the regex scan was far more expensive than the slicing, and most
+            # unparseable lines can be rejected without a second decode.
+            json_start = line.find('{')
+            json_end = line.rfind('}')
+            if 0 <= json_start < json_end:
+                return parse_json_event(line[json_start:json_end + 1], nested=True)
 
         # TODO: There are too many to be logged.  It might be useful
         # at some point to collect stats on the length of truncation
@@ -126,7 +161,9 @@ def datetime_to_datestamp(datetime_obj):
 
 def timestamp_to_datestamp(timestamp):
     """Returns a string with the date value of the provided ISO datetime string."""
-    return timestamp.split('T')[0]
+    # The date is the fixed-width %Y-%m-%d prefix, so slice it rather than
+    # paying for a split and the unused time substring.
+    return timestamp[:10]
 
 
 def get_event_time(event):
@@ -178,7 +215,10 @@ def get_event_data(event):
         # failing to parse it as a JSON string, just return an empty dict.
         return {}
 
-    if isinstance(event_value, basestring):
+    # JSON decoding only ever produces exact str or unicode values, so an
+    # exact type check is sufficient here, and cheaper per event than an
+    # isinstance() test against the basestring ABC.
+    if type(event_value) in (str, unicode):
         if len(event_value) == 512 and 'POST' in event_value:
             # It's an implicit event with a truncated JSON string, as generated by tracking middleware.
             log.debug("encountered implicit event with truncated event value: %s", event)
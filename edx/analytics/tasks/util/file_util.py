@@ -1,10 +1,13 @@
 """
 Utility methods interact with files.
 """
+import gzip
 import logging
 import os
+import subprocess
 import sys
 from contextlib import contextmanager
+from distutils.spawn import find_executable
 
 from edx.analytics.tasks.util.url import get_target_from_url
 
@@ -31,6 +34,52 @@ def copy_file_to_file(src_file, output_file, progress=None):
     log.info('Copy to output complete')
 
 
+@contextmanager
+def open_gzip_stream(output_file):
+    """
+    Open a gzip compression stream that writes to an already-open output file.
+
+    Python's gzip module deflates on a single thread with significant
+    per-write overhead, so when the external `pigz` compressor is installed
+    and the output file is backed by a real file descriptor, pipe the data
+    through a pigz subprocess instead.  Otherwise fall back to gzip.GzipFile,
+    which works with any file-like object (e.g. StringIO in tests).
+
+    Both branches write a deterministic header (no file name, zero mtime),
+    so unchanged output files compare equal across runs.
+    """
+    pigz_path = find_executable('pigz')
+    output_fileno = None
+    if pigz_path is not None:
+        try:
+            output_fileno = output_file.fileno()
+        except Exception:  # pylint: disable=broad-except
+            # Not backed by a real file descriptor, so pigz cannot write to it.
+            output_fileno = None
+
+    if output_fileno is not None:
+        # -n omits the file name and mod time from the header, matching the
+        # mtime=0 determinism of the GzipFile fallback below.
+        compressor = subprocess.Popen(
+            [pigz_path, '-c', '-n'], stdin=subprocess.PIPE, stdout=output_file
+        )
+        try:
+            yield compressor.stdin
+        finally:
+            compressor.stdin.close()
+            returncode = compressor.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, pigz_path)
+    else:
+        # mtime=0 keeps the gzip header deterministic, so unchanged output
+        # files compare equal across runs.
+        outfile = gzip.GzipFile(mode='wb', fileobj=output_file, mtime=0)
+        try:
+            yield outfile
+        finally:
+            outfile.close()
+
+
 @contextmanager
 def read_config_file(filename):
     """Read a config file from either an external source (S3, HDFS etc) or the "share" directory of this repo."""
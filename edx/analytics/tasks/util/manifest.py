@@ -83,10 +83,12 @@ class ManifestInputTargetMixin(object):
         manifest_target = cls(*init_args, **init_kwargs)
         if not manifest_target.exists():
             log.info('Writing manifest file %s', manifest_target.path)
+            paths = [target.path for target in other_targets]
             with manifest_target.open('w') as manifest_file:
-                for target in other_targets:
-                    manifest_file.write(target.path)
-                    manifest_file.write('\n')
+                # Join the paths and write them in one call, rather than making
+                # two write calls per entry.
+                if paths:
+                    manifest_file.write('\n'.join(paths) + '\n')
         else:
             log.debug('Reusing existing manifest found at %s', manifest_target.path)
 
@@ -148,6 +148,14 @@ class S3HdfsTarget(HdfsTarget):
     def __init__(self, path=None, format=Plain, is_tmp=False):
         super(S3HdfsTarget, self).__init__(path=path, format=format, is_tmp=is_tmp)
 
+    # Shared by all instances within one process: reducers that produce many
+    # output files create one target per key, and each client construction
+    # re-parses configuration.  The cache is keyed by process id because
+    # luigi forks worker processes, and a client inherited across a fork
+    # shares its pooled HTTP connections with the parent.
+    s3_client = None
+    s3_client_pid = None
+
     def open(self, mode='r'):
         if mode not in ('r', 'w'):
             raise ValueError("Unsupported open mode '{mode}'".format(mode=mode))
@@ -156,9 +164,11 @@ class S3HdfsTarget(HdfsTarget):
             return super(S3HdfsTarget, self).open(mode=mode)
         else:
             safe_path = self.path.replace('s3n://', 's3://')
-            if not hasattr(self, 's3_client'):
-                self.s3_client = ScalableS3Client()
-            return AtomicS3File(safe_path, self.s3_client, policy=DEFAULT_KEY_ACCESS_POLICY)
+            pid = os.getpid()
+            if S3HdfsTarget.s3_client is None or S3HdfsTarget.s3_client_pid != pid:
+                S3HdfsTarget.s3_client = ScalableS3Client()
+                S3HdfsTarget.s3_client_pid = pid
+            return AtomicS3File(safe_path, S3HdfsTarget.s3_client, policy=DEFAULT_KEY_ACCESS_POLICY)
 
 
 def canonicalize_s3_url(url):
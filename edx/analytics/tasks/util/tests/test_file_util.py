@@ -0,0 +1,75 @@
+"""Tests for the gzip compression stream helper."""
+
+import gzip
+import os
+import stat
+import StringIO
+import subprocess
+import tempfile
+from distutils.spawn import find_executable
+from unittest import TestCase
+
+from mock import patch
+
+from edx.analytics.tasks.util.file_util import open_gzip_stream
+
+CONTENT = 'first line\nsecond line\n'
+
+
+class OpenGzipStreamTest(TestCase):
+    """Ensure both the pigz subprocess and GzipFile branches produce valid, deterministic gzip output."""
+
+    def write_content_through_stream(self, output_file):
+        """Write the test content to the output file through a compression stream."""
+        with open_gzip_stream(output_file) as outfile:
+            outfile.write(CONTENT)
+
+    def assert_valid_deterministic_gzip(self, compressed):
+        """Confirm the compressed bytes decompress to the content and carry a zeroed header mtime."""
+        decompressed = gzip.GzipFile(fileobj=StringIO.StringIO(compressed)).read()
+        self.assertEquals(decompressed, CONTENT)
+        # Bytes 4-7 of the gzip header hold the modification time.
+        self.assertEquals(compressed[4:8], '\x00\x00\x00\x00')
+
+    def write_content_to_temp_file(self):
+        """Write the test content through a stream backed by a real file, and return the compressed bytes."""
+        with tempfile.TemporaryFile() as output_file:
+            self.write_content_through_stream(output_file)
+            output_file.seek(0)
+            return output_file.read()
+
+    @patch('edx.analytics.tasks.util.file_util.find_executable', return_value=None)
+    def test_gzip_fallback_without_compressor(self, _mock_find_executable):
+        compressed = self.write_content_to_temp_file()
+        self.assert_valid_deterministic_gzip(compressed)
+
+    def test_gzip_fallback_without_fileno(self):
+        # Even with a compressor installed, a file-like object with no real
+        # file descriptor must use the GzipFile fallback.
+        with patch('edx.analytics.tasks.util.file_util.find_executable', return_value='/usr/bin/gzip'):
+            output_file = StringIO.StringIO()
+            self.write_content_through_stream(output_file)
+        self.assert_valid_deterministic_gzip(output_file.getvalue())
+
+    def test_compressor_subprocess(self):
+        # Stand in for pigz with gzip, which accepts the same -c -n flags.
+        gzip_path = find_executable('gzip')
+        if gzip_path is None:
+            self.skipTest('no gzip executable available')
+        with patch('edx.analytics.tasks.util.file_util.find_executable', return_value=gzip_path):
+            compressed = self.write_content_to_temp_file()
+        self.assert_valid_deterministic_gzip(compressed)
+
+    def test_compressor_failure(self):
+        # Stand in for pigz with a compressor that consumes its input and
+        # then exits with an error.
+        script_file = tempfile.NamedTemporaryFile(suffix='.sh', delete=False)
+        self.addCleanup(os.unlink, script_file.name)
+        with script_file:
+            script_file.write('#!/bin/sh\ncat > /dev/null\nexit 3\n')
+        os.chmod(script_file.name, os.stat(script_file.name).st_mode | stat.S_IXUSR)
+
+        with patch('edx.analytics.tasks.util.file_util.find_executable', return_value=script_file.name):
+            with tempfile.TemporaryFile() as output_file:
+                with self.assertRaises(subprocess.CalledProcessError):
+                    self.write_content_through_stream(output_file)
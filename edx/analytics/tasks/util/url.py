@@ -27,6 +27,25 @@ from edx.analytics.tasks.util.s3_util import DEFAULT_KEY_ACCESS_POLICY, S3HdfsTa
 
 log = logging.getLogger(__name__)
 
+# A single S3 client shared by all S3 targets built in one process.
+# Constructing a client parses configuration each time, which adds up when
+# building targets for thousands of URLs.  The cache is keyed by process id
+# because luigi forks worker processes: a client inherited across a fork
+# shares its pooled HTTP connections with the parent, and two processes
+# writing to the same socket corrupt requests or hang.
+_shared_s3_client = None
+_shared_s3_client_pid = None
+
+
+def get_shared_s3_client():
+    """Return the S3 client shared within this process, creating it on first use and after a fork."""
+    global _shared_s3_client, _shared_s3_client_pid  # pylint: disable=global-statement
+    pid = os.getpid()
+    if _shared_s3_client is None or _shared_s3_client_pid != pid:
+        _shared_s3_client = ScalableS3Client()
+        _shared_s3_client_pid = pid
+    return _shared_s3_client
+
 
 class MarkerMixin(object):
     """This mixin handles Targets that cannot accurately be measured by the existence of data files, and instead need
@@ -139,7 +158,7 @@ def get_target_class_from_url(url, marker=False):
         # everything else off the url and pass that in to the target.
         url = parsed_url.path
     if issubclass(target_class, S3Target):
-        kwargs['client'] = ScalableS3Client()
+        kwargs['client'] = get_shared_s3_client()
         kwargs['policy'] = DEFAULT_KEY_ACCESS_POLICY
 
     url = url.rstrip('/')
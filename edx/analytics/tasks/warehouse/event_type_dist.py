@@ -31,12 +31,16 @@ class EventTypeDistributionTask(EventLogSelectionMixin, MapReduceJobTask):
     def parse_events_list_file(self):
         """ Read and parse the known events list file and populate it in a dictionary."""
         parsed_events = {}
+        # Read and split the whole file in one pass, and split each line only
+        # once, instead of iterating and splitting per line twice over.
         with self.input_local().open() as f_in:
-            lines = f_in.readlines()
-            for line in lines:
-                if (not line.startswith('#') and len(line.split("\t")) is 3):
-                    parts = line.rstrip('\n').split("\t")
-                    parsed_events[(parts[1], parts[2])] = parts[0]
+            lines = f_in.read().splitlines()
+        for line in lines:
+            if line.startswith('#'):
+                continue
+            parts = line.split("\t")
+            if len(parts) == 3:
+                parsed_events[(parts[1], parts[2])] = parts[0]
         return parsed_events
 
     def mapper(self, line):
@@ -19,6 +19,10 @@ from edx.analytics.tasks.util.url import ExternalURL, get_target_from_url, url_p
 
 log = logging.getLogger(__name__)
 
+# Finds the precision and optional scale in a Vertica "numeric(...)" type.
+# Compiled once here rather than on every column conversion.
+NUMERIC_PRECISION_AND_SCALE_PATTERN = re.compile(r'[0-9]+')
+
 
 class LoadVerticaTableFromS3ToSnowflakeTask(VerticaTableExportMixin, VerticaTableFromS3Mixin, SnowflakeLoadFromHiveTSVTask):
     """
@@ -37,11 +41,13 @@ class LoadVerticaTableFromS3ToSnowflakeTask(VerticaTableExportMixin, VerticaTabl
                 column_name = '"{}"'.format(column_name)
 
             if field_type.startswith('long '):
-                field_type = field_type.lstrip('long ')
+                # Slice off the prefix; lstrip would strip a character set,
+                # eating leading l/o/n/g/space characters from the remainder.
+                field_type = field_type[len('long '):]
             elif 'numeric(' in field_type:
                 # Snowflake only handles numeric precision up to 38. This regex should find either 1 or 2 numbers
                 # ex: numeric(52) or numeric(58, 4). First number is precision, second is scale.
-                precision_and_scale = re.findall(r'[0-9]+', field_type)
+                precision_and_scale = NUMERIC_PRECISION_AND_SCALE_PATTERN.findall(field_type)
                 if int(precision_and_scale[0]) > 38:
                     # If it has scale, try to preserve that
                     if len(precision_and_scale) == 2:
@@ -161,11 +167,13 @@ class LoadVerticaTableFromS3WithMetadataToSnowflakeTask(VerticaTableExportMixin,
                 column_name = '"{}"'.format(column_name)
 
             if field_type.startswith('long '):
-                field_type = field_type.lstrip('long ')
+                # Slice off the prefix; lstrip would strip a character set,
+                # eating leading l/o/n/g/space characters from the remainder.
+                field_type = field_type[len('long '):]
             elif 'numeric(' in field_type:
                 # Snowflake only handles numeric precision up to 38. This regex should find either 1 or 2 numbers
                 # ex: numeric(52) or numeric(58, 4). First number is precision, second is scale.
-                precision_and_scale = re.findall(r'[0-9]+', field_type)
+                precision_and_scale = NUMERIC_PRECISION_AND_SCALE_PATTERN.findall(field_type)
                 if int(precision_and_scale[0]) > 38:
                     # If it has scale, try to preserve that
                     if len(precision_and_scale) == 2:
@@ -425,6 +425,16 @@ class SegmentEventRecordTaskMapTest(BaseSegmentEventRecordTaskMapTest, unittest.
         timestamp = self.task.get_event_arrival_time(line_json)
         self.assertEquals(timestamp, expected_timestamp)
 
+    def test_arrival_time_from_received_at_only(self):
+        # A line whose only time field is "receivedAt" must survive the
+        # raw-line time-field prefilter and map successfully.
+        template = self.event_templates['android_screen']
+        del template['timestamp']
+        del template['sentAt']
+        line = self.create_event_log_line(template=template)
+        mapper_output = tuple(self.task.mapper(line))
+        self.assertEquals(len(mapper_output), 1)
+
     def test_android_screen(self):
         template = self.event_templates['android_screen']
         event = self.create_event_log_line(template=template)